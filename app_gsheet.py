@@ -1,13 +1,20 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 from datetime import datetime, date, timedelta
 from pathlib import Path
 import gspread
 from google.oauth2.service_account import Credentials
 import random
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from itertools import takewhile
 import base64
 import hashlib
 import hmac
+import logging
+import ssl
+import uuid
 
 # ----------------- 기본 설정 -----------------
 st.set_page_config(
@@ -22,22 +29,35 @@ def _decode_salt(s: str) -> bytes:
     except Exception:
         return bytes.fromhex(s)
 
-def _verify_password(password: str) -> bool:
-    if "auth" not in st.secrets:
-        return False
+# PBKDF2-SHA256은 OpenSSL 3 이상에서 SHA 하드웨어 가속(SHA-NI 등)을 사용
+@st.cache_resource(show_spinner=False)
+def _check_openssl():
+    if "openssl" not in ssl.OPENSSL_VERSION.lower() or ssl.OPENSSL_VERSION_INFO[0] < 3:
+        logging.getLogger(__name__).warning(
+            "hashlib이 OpenSSL 3+ 기반이 아닙니다 (%s). 로그인 해시 계산이 느릴 수 있습니다.", ssl.OPENSSL_VERSION
+        )
+
+_check_openssl()
+
+AUTH_CONFIGURED = (
+    "auth" in st.secrets and "password_hash" in st.secrets["auth"] and "salt" in st.secrets["auth"]
+)
+
+@st.cache_resource(show_spinner=False)
+def _auth_params():
+    # secrets 파싱/디코딩은 프로세스당 한 번만
     auth = st.secrets["auth"]
-    if "password_hash" not in auth or "salt" not in auth:
-        return False
-    iterations = int(auth.get("iterations", 200_000))
-    salt = _decode_salt(auth["salt"])
+    return _decode_salt(auth["salt"]), int(auth.get("iterations", 200_000)), bytes.fromhex(auth["password_hash"])
+
+def _verify_password(password: str) -> bool:
+    salt, iterations, expected = _auth_params()
     derived = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, iterations)
-    expected = bytes.fromhex(auth["password_hash"])
     return hmac.compare_digest(derived, expected)
 
 if "authenticated" not in st.session_state:
     st.session_state.authenticated = False
 
-if "auth" not in st.secrets or "password_hash" not in st.secrets["auth"] or "salt" not in st.secrets["auth"]:
+if not AUTH_CONFIGURED:
     st.error("Secrets에 [auth] 설정이 필요합니다. (password_hash, salt, iterations)")
     st.stop()
 
@@ -94,6 +114,11 @@ LOG_HEADERS = [
     "subject",
 ]
 SUBJECT_HEADERS = ["name", "total_lectures", "completed_lectures", "active"]
+SHEETS_SCHEMA = {
+    "config": CONFIG_HEADERS,
+    "log": LOG_HEADERS,
+    "subjects": SUBJECT_HEADERS,
+}
 
 PHASE_LABELS = {
     1: "1단계 – 출석 + 공부 모양",
@@ -109,6 +134,9 @@ MODE_LABELS = {
     "off": "OFF 모드",
 }
 
+CAT_COLORS = {"morning": "🌅", "study": "📚", "exercise": "💪", "work": "💼", "rest": "😴"}
+CHECKABLE_CATEGORIES = frozenset({"study", "exercise"})
+
 DAILY_GRADE_HINT = "일일 등급 기준: S ≥ 4.6h, C ≥ 3.9h, B ≥ 3.1h, A ≥ 2.5h, 그 미만 D-"
 WEEKLY_GRADE_HINT = "주간 등급 기준: S ≥ 32h, C ≥ 27h, B ≥ 22h, A ≥ 18h, 그 미만 D-"
 
@@ -440,6 +468,10 @@ EXCEL_BAKING_CHECKLIST = [
     },
 ]
 
+SPREADSHEET_URL = st.secrets.get("gsheet", {}).get("spreadsheet_url")
+if not SPREADSHEET_URL:
+    st.stop()
+
 DEFAULT_CONFIG = {
     "start_date": date.today().isoformat(),
     "auto_phase": True,
@@ -449,20 +481,27 @@ DEFAULT_CONFIG = {
 
 # ----------------- GSheet 클라이언트 -----------------
 
+_TRUE_STRINGS = ("true", "1", "yes", "y", "t")
+_FALSE_STRINGS = ("false", "0", "no", "n", "f", "")
+# 1 == 1.0 == True 이므로 숫자/불리언도 같은 집합으로 판정
+_BOOL_TRUE = frozenset(_TRUE_STRINGS) | {True}
+_BOOL_FALSE = frozenset(_FALSE_STRINGS) | {False}
+
+
 def _parse_bool(value, default: bool = False) -> bool:
     if value is None or pd.isna(value):
         return default
-    if isinstance(value, bool):
-        return value
-    if isinstance(value, (int, float)):
-        return bool(value)
-    s = str(value).strip().lower()
-    if s in ("true", "1", "yes", "y", "t"):
+    v = value.strip().lower() if isinstance(value, str) else value
+    if v in _BOOL_TRUE:
         return True
-    if s in ("false", "0", "no", "n", "f", ""):
+    if v in _BOOL_FALSE:
         return False
+    if isinstance(v, (int, float)):
+        return bool(v)
     return default
 
+# 인증/스프레드시트 핸들은 프로세스당 한 번만 생성 (매 rerun마다 OAuth 왕복 방지)
+@st.cache_resource(show_spinner=False)
 def get_client():
     creds = Credentials.from_service_account_info(st.secrets["gcp_service_account"])
     scoped = creds.with_scopes([
@@ -472,11 +511,9 @@ def get_client():
     return gspread.authorize(scoped)
 
 
-def get_workbook():
-    client = get_client()
-    if "gsheet" not in st.secrets or "spreadsheet_url" not in st.secrets["gsheet"]:
-        st.stop()
-    return client.open_by_url(st.secrets["gsheet"]["spreadsheet_url"])
+@st.cache_resource(show_spinner=False)
+def get_workbook(url: str = SPREADSHEET_URL):
+    return get_client().open_by_url(url)
 
 
 def ensure_worksheet(wb, name: str, headers: list):
@@ -493,12 +530,148 @@ def ensure_worksheet(wb, name: str, headers: list):
         ws.insert_row(headers, 1)
     return ws
 
+@st.cache_resource(show_spinner=False)
+def _ensure_all_sheets() -> dict:
+    # 워크시트 목록은 한 번만 조회하고, 없는 시트만 생성해서 핸들을 재사용
+    wb = get_workbook()
+    existing = {ws.title: ws for ws in wb.worksheets()}
+    return {
+        name: existing[name] if name in existing else ensure_worksheet(wb, name, headers)
+        for name, headers in SHEETS_SCHEMA.items()
+    }
+
 # ----------------- 저장/불러오기 -----------------
 
-def load_config():
+def rows_to_records(header: list, rows: list) -> list:
+    # API는 뒤쪽 빈 셀을 잘라서 주므로 헤더 길이에 맞춰 채움
+    width = len(header)
+    return [dict(zip(header, row + [""] * (width - len(row)))) for row in rows]
+
+
+def _values_to_df(headers: list, rows: list) -> pd.DataFrame:
+    # 행 단위 dict를 만들지 않고 값 목록에서 바로 DataFrame 생성
+    df = pd.DataFrame(rows)
+    df = df.iloc[:, : len(headers)]
+    df.columns = headers[: df.shape[1]]
+    return df.reindex(columns=headers)
+
+
+def _normalize_df(df: pd.DataFrame, int_fields=(), bool_fields=None) -> pd.DataFrame:
+    # _parse_bool / int(float(...)) 를 컬럼 단위로 적용
+    for f in int_fields:
+        df[f] = pd.to_numeric(df[f], errors="coerce").fillna(0).astype(int)
+    for f, default in (bool_fields or {}).items():
+        s = df[f].astype(str).str.strip().str.lower()
+        df[f] = s.isin(_TRUE_STRINGS) | (default & ~s.isin(_FALSE_STRINGS))
+    return df
+
+
+# st.cache_data는 호출마다 사본을 돌려주므로 세션에서 수정해도 캐시는 그대로 유지됨
+@st.cache_data(ttl=60, show_spinner=False)
+def load_all_sheets() -> dict:
+    # 모든 시트를 values.batchGet 한 번으로 조회
     wb = get_workbook()
-    ws = ensure_worksheet(wb, "config", CONFIG_HEADERS)
-    rows = ws.get_all_records()
+    sheets = _ensure_all_sheets()
+    ranges = [f"{name}!A:Z" for name in SHEETS_SCHEMA]
+    try:
+        resp = wb.values_batch_get(ranges)
+        all_values = [value_range.get("values", []) for value_range in resp.get("valueRanges", [])]
+    except gspread.exceptions.APIError:
+        # batchGet이 거부되면 시트별 조회를 병렬로 (네트워크 대기 중에는 GIL이 풀림)
+        with ThreadPoolExecutor(max_workers=len(sheets)) as ex:
+            futures = {name: ex.submit(ws.get_all_values) for name, ws in sheets.items()}
+        all_values = [futures[name].result() for name in SHEETS_SCHEMA]
+    records = {}
+    for (name, headers), values in zip(SHEETS_SCHEMA.items(), all_values):
+        if values and values[0][: len(headers)] == headers:
+            values = values[1:]
+        else:
+            # 헤더가 없으면 추가 (기존 행은 데이터로 취급)
+            ensure_worksheet(wb, name, headers)
+        records[name] = values
+    return {
+        "config": load_config(rows_to_records(CONFIG_HEADERS, records.get("config", []))),
+        "log_df": load_log(records.get("log", [])),
+        "subjects": load_subjects(records.get("subjects", [])),
+    }
+
+
+def _queue_write(name: str, headers: list, rows: list):
+    # 바로 쓰지 않고 세션 큐에 모아 두었다가 _flush_writes()에서 한 번에 전송
+    st.session_state.setdefault("_pending_writes", {})[name] = [headers] + rows
+
+
+def _dirty_span(prev: list, body: list):
+    # 현재 시트 내용과 달라진 행 구간 [lo, hi) (0-based, hi는 시트/새 길이 중 큰 값 기준)
+    n = min(len(prev), len(body))
+    lo = next((i for i in range(n) if prev[i] != body[i]), n)
+    if len(prev) != len(body):
+        return lo, max(len(prev), len(body))
+    if lo == n:
+        return None
+    hi = next(i for i in range(n, lo, -1) if prev[i - 1] != body[i - 1])
+    return lo, hi
+
+
+def _trim_row(row: list) -> list:
+    # API는 뒤쪽 빈 셀을 잘라서 주므로 비교 전에 양쪽 모두 잘라 냄
+    row = list(row)
+    while row and row[-1] == "":
+        row.pop()
+    return row
+
+
+def _flush_writes() -> bool:
+    # 큐에 쌓인 시트를 실제 시트 내용과 비교해 바뀐 행 구간만 전송 (읽기 1번 + 쓰기 1번, 성공 여부 반환)
+    pending = st.session_state.get("_pending_writes")
+    if not pending:
+        return True
+    # 마지막으로 전송에 성공한 내용과 같으면 API 호출 없이 큐에서 제거
+    save_hashes = st.session_state.setdefault("_save_hashes", {})
+    digests = {
+        name: hashlib.blake2b(repr(body).encode("utf-8"), digest_size=16).digest() for name, body in pending.items()
+    }
+    for name, digest in digests.items():
+        if save_hashes.get(name) == digest:
+            del pending[name]
+    if not pending:
+        return True
+    names = list(pending)
+    try:
+        wb = get_workbook()
+        # 다른 탭/기기나 손으로 고친 내용이 있을 수 있으므로 세션 기록이 아니라 시트를 기준으로 비교
+        resp = wb.values_batch_get(
+            [f"{name}!A:ZZ" for name in names], params={"valueRenderOption": "UNFORMATTED_VALUE"}
+        )
+        current = [value_range.get("values", []) for value_range in resp.get("valueRanges", [])]
+        data = []
+        for name, sheet_rows in zip(names, current):
+            body = pending[name]
+            span = _dirty_span([_trim_row(r) for r in sheet_rows], [_trim_row(r) for r in body])
+            if span is None:
+                continue
+            lo, hi = span
+            # 시트가 더 길면 남는 행은 같은 batchUpdate 안에서 빈 값으로 덮음 (별도 clear 호출 없음)
+            width = len(SHEETS_SCHEMA[name])
+            values = body[lo:hi] + [[""] * width] * (hi - max(lo, len(body)))
+            end = gspread.utils.rowcol_to_a1(hi, width)
+            data.append({"range": f"{name}!A{lo + 1}:{end}", "values": values})
+        if data:
+            wb.values_batch_update(body={"valueInputOption": "RAW", "data": data})
+    except Exception as e:
+        # 큐는 그대로 두고 다음 실행에서 다시 시도
+        st.error(f"시트 저장 실패 (다음 실행 때 다시 시도합니다): {e}")
+        return False
+    # 전송에 성공한 뒤에만 큐에서 제거하고 digest 기록
+    for name in names:
+        pending.pop(name, None)
+        save_hashes[name] = digests[name]
+    if data:
+        load_all_sheets.clear()
+    return True
+
+
+def load_config(rows: list) -> dict:
     cfg = rows[0] if rows else DEFAULT_CONFIG.copy()
     # 기본값 보정
     for k, v in DEFAULT_CONFIG.items():
@@ -514,79 +687,70 @@ def load_config():
 
 
 def save_config(cfg: dict):
-    wb = get_workbook()
-    ws = ensure_worksheet(wb, "config", CONFIG_HEADERS)
-    ws.clear()
-    ws.append_row(CONFIG_HEADERS)
     row = [cfg.get(k, DEFAULT_CONFIG.get(k)) for k in CONFIG_HEADERS]
-    ws.append_row(row)
+    _queue_write("config", CONFIG_HEADERS, [row])
 
 
-def load_subjects():
-    wb = get_workbook()
-    ws = ensure_worksheet(wb, "subjects", SUBJECT_HEADERS)
-    rows = ws.get_all_records()
+def load_subjects(rows: list) -> list:
     if not rows:
         return [{"name": "민법", "total_lectures": 220, "completed_lectures": 0, "active": True}]
     # 타입 보정
-    for r in rows:
-        try:
-            r["total_lectures"] = int(float(r.get("total_lectures", 0) or 0))
-        except Exception:
-            r["total_lectures"] = 0
-        try:
-            r["completed_lectures"] = int(float(r.get("completed_lectures", 0) or 0))
-        except Exception:
-            r["completed_lectures"] = 0
-        r["active"] = _parse_bool(r.get("active", True), default=True)
-    return rows
+    df = _normalize_df(
+        _values_to_df(SUBJECT_HEADERS, rows).fillna(""),
+        int_fields=["total_lectures", "completed_lectures"],
+        bool_fields={"active": True},
+    )
+    return df.to_dict("records")
 
 
 def save_subjects(subjects: list):
-    wb = get_workbook()
-    ws = ensure_worksheet(wb, "subjects", SUBJECT_HEADERS)
-    ws.clear()
-    ws.append_row(SUBJECT_HEADERS)
-    for s in subjects:
-        ws.append_row([s.get(h, "") for h in SUBJECT_HEADERS])
+    rows = [[s.get(h, "") for h in SUBJECT_HEADERS] for s in subjects]
+    _queue_write("subjects", SUBJECT_HEADERS, rows)
 
 
-def load_log() -> pd.DataFrame:
-    wb = get_workbook()
-    ws = ensure_worksheet(wb, "log", LOG_HEADERS)
-    rows = ws.get_all_records()
+def load_log(rows: list) -> pd.DataFrame:
     if not rows:
         return pd.DataFrame(columns=LOG_HEADERS)
-    df = pd.DataFrame(rows)
-    if "date" in df.columns:
+    df = _normalize_df(
+        _values_to_df(LOG_HEADERS, rows),
+        int_fields=["phase", "estimated_minutes"],
+        bool_fields={"done": False},
+    )
+    try:
+        # 앱이 쓰는 날짜는 ISO 형식이므로 형식 추론 없이 파싱
+        df["date"] = pd.to_datetime(df["date"], format="ISO8601").dt.date
+    except ValueError:
         df["date"] = pd.to_datetime(df["date"]).dt.date
-    for col in LOG_HEADERS:
-        if col not in df.columns:
-            df[col] = pd.NA
-    if "done" in df.columns:
-        df["done"] = df["done"].apply(lambda v: _parse_bool(v, default=False))
-    if "estimated_minutes" in df.columns:
-        df["estimated_minutes"] = pd.to_numeric(df["estimated_minutes"], errors="coerce").fillna(0).astype(int)
-    if "phase" in df.columns:
-        df["phase"] = pd.to_numeric(df["phase"], errors="coerce").fillna(0).astype(int)
     for _col in ["energy", "focus"]:
-        if _col in df.columns:
-            df[_col] = pd.to_numeric(df[_col], errors="coerce").astype("Int64")
-    return df[LOG_HEADERS]
+        df[_col] = pd.to_numeric(df[_col], errors="coerce").astype("Int64")
+    # 날짜가 비어 있는 행(시트의 빈 줄)은 제외
+    df = df[df["date"].notna()].reset_index(drop=True)
+    return _apply_log_dtypes(df)
+
+
+def _apply_log_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    # 값 종류가 적은 컬럼은 category, 숫자는 작은 정수형으로 (메모리/groupby 속도)
+    for c in ("day_type", "mode", "block", "subject"):
+        df[c] = df[c].astype("category")
+    df["phase"] = df["phase"].astype("int8")
+    df["estimated_minutes"] = df["estimated_minutes"].astype("int16")
+    df["done"] = df["done"].astype(bool)
+    return df
+
+
+def _sheet_cell(v):
+    # 결측은 빈 칸, NumPy 스칼라(Int64 컬럼 등)는 JSON으로 보낼 수 있게 파이썬 값으로
+    if pd.isna(v):
+        return ""
+    return v.item() if isinstance(v, np.generic) else v
 
 
 def save_log(df: pd.DataFrame):
-    wb = get_workbook()
-    ws = ensure_worksheet(wb, "log", LOG_HEADERS)
-    ws.clear()
-    ws.append_row(LOG_HEADERS)
-    if df.empty:
-        return
-    # 날짜를 문자열로 변환
-    out_df = df.copy()
-    out_df["date"] = out_df["date"].astype(str)
-    rows = out_df[LOG_HEADERS].fillna("").values.tolist()
-    ws.append_rows(rows)
+    # 컬럼 사본을 만들지 않고 컬럼별 이터레이터를 zip해서 한 행씩 생성 (날짜는 문자열)
+    cols = [map(str, df["date"])]
+    cols += [map(_sheet_cell, df[c]) for c in LOG_HEADERS[1:]]
+    rows = [list(r) for r in zip(*cols)]
+    _queue_write("log", LOG_HEADERS, rows)
 
 # ----------------- Phase / Week 계산 -----------------
 
@@ -617,10 +781,34 @@ def get_week_range(d: date):
 
 # ----------------- 상세 시간표 -----------------
 
-def get_detailed_schedule(phase: int, day_type: str, mode: str):
+# 컬럼(SoA) 형태의 시간표: 같은 인덱스가 한 블록
+Schedule = namedtuple("Schedule", ["times", "names", "clean_names", "categories", "minutes", "descs"])
+
+
+def _clean_block_name(name: str) -> str:
+    # "   └ 복습용 문풀" → "복습용 문풀"
+    name = name.strip()
+    return name[1:].strip() if name.startswith("└") else name
+
+
+def _to_schedule(items: list) -> Schedule:
+    times, names, categories, minutes, descs = zip(*items)
+    clean_names = tuple(_clean_block_name(n) for n in names)
+    categories = np.array(categories)
+    minutes = np.array(minutes, dtype=np.int16)
+    # 메모이즈된 결과를 공유하므로 읽기 전용으로 고정
+    categories.flags.writeable = False
+    minutes.flags.writeable = False
+    return Schedule(times, names, clean_names, categories, minutes, descs)
+
+
+# (phase, day_type, mode) 조합이 36개뿐이라 결과를 메모이즈 (불변 Schedule로 반환)
+# 스크립트는 rerun마다 새로 실행되므로 lru_cache 대신 프로세스 전역인 st.cache_resource 사용
+@st.cache_resource(show_spinner=False)
+def get_detailed_schedule(phase: int, day_type: str, mode: str) -> Schedule:
     schedule = []
     if mode == "off":
-        return [("전일", "OFF 모드 (완전 휴식)", "rest", 0, "푹 쉬고 내일 복귀하세요")]
+        return _to_schedule([("전일", "OFF 모드 (완전 휴식)", "rest", 0, "푹 쉬고 내일 복귀하세요")])
 
     if day_type == "weekday":
         schedule.append(("05:30", "기상 + 준비", "morning", 0, "물 한잔, 세수, 스트레칭"))
@@ -693,32 +881,24 @@ def get_detailed_schedule(phase: int, day_type: str, mode: str):
             schedule.append(("18:00-19:30", "✏️ 문풀 2차", "study", 90, "하루 전체 + 주간 누적 20-30문제"))
             schedule.append(("19:30-20:00", "📝 정리 + 내일 준비", "study", 30, "핵심 메모, 내일 복습 포인트"))
         schedule.append(("20:00 이후", "자유시간 + 산책", "rest", 0, ""))
-    return schedule
+    return _to_schedule(schedule)
 
 
+@st.cache_resource(show_spinner=False)
 def get_checkable_blocks(phase: int, day_type: str, mode: str):
     schedule = get_detailed_schedule(phase, day_type, mode)
-    blocks = []
-    for item in schedule:
-        time, name, category, minutes, desc = item
-        if category in ["study", "exercise"] and minutes >= 0:
-            clean_name = name.strip()
-            if clean_name.startswith("└"):
-                clean_name = clean_name[1:].strip()
-            blocks.append((clean_name, minutes, desc))
-    return blocks
+    mask = np.isin(schedule.categories, list(CHECKABLE_CATEGORIES)) & (schedule.minutes >= 0)
+    return tuple(
+        (schedule.clean_names[i], int(schedule.minutes[i]), schedule.descs[i]) for i in np.flatnonzero(mask)
+    )
+
 
 # ----------------- 동기부여 메시지 -----------------
 
-def get_logged_day_context(log_df: pd.DataFrame, target_date: date):
-    if log_df.empty:
-        return None
-    if "date" not in log_df.columns:
-        return None
-    mask = log_df["date"] == target_date
-    if not mask.any():
+def get_logged_day_context(day_rows: pd.DataFrame):
+    if day_rows.empty:
         return None
-    row = log_df[mask].iloc[0]
+    row = day_rows.iloc[0]
     try:
         return {"phase": int(row["phase"]), "day_type": row["day_type"], "mode": row["mode"]}
     except Exception:
@@ -739,14 +919,16 @@ MOTIVATION_MESSAGES = {
 }
 
 
-def get_motivation_message(streak: int, mode: str = "normal"):
+def get_motivation_message(streak: int, mode: str = "normal", target_date: date = None):
+    # 같은 날짜/streak/모드에서는 rerun마다 문구가 바뀌지 않도록 고정 시드 사용
+    rng = random.Random(f"{target_date}|{streak}|{mode}")
     if mode == "low":
-        return random.choice(MOTIVATION_MESSAGES["low_mode"])
+        return rng.choice(MOTIVATION_MESSAGES["low_mode"])
     if streak >= 7:
-        return random.choice(MOTIVATION_MESSAGES["streak_high"]).format(streak=streak)
+        return rng.choice(MOTIVATION_MESSAGES["streak_high"]).format(streak=streak)
     if streak >= 2:
-        return random.choice(MOTIVATION_MESSAGES["streak_start"]).format(streak=streak)
-    return random.choice(MOTIVATION_MESSAGES["default"])
+        return rng.choice(MOTIVATION_MESSAGES["streak_start"]).format(streak=streak)
+    return rng.choice(MOTIVATION_MESSAGES["default"])
 
 # ----------------- 등급 -----------------
 
@@ -775,27 +957,22 @@ def get_lecture_increment(block_name: str) -> int:
     return 0
 
 
-def lecture_credits_from_rows(rows: pd.DataFrame) -> int:
-    if rows.empty:
-        return 0
-    return sum(get_lecture_increment(b) for b in rows.loc[rows["done"] == True, "block"])
+def lecture_increments(blocks: pd.Series) -> pd.Series:
+    # 블록 이름 종류가 적으므로 고유값마다 한 번만 계산해서 매핑
+    # (categorical에 map하면 결과도 categorical이 될 수 있어 fillna(0)이 실패하므로 일반 값으로 변환 후 매핑)
+    table = {b: get_lecture_increment(b) for b in blocks.unique()}
+    return blocks.astype(object).map(table).fillna(0).astype("int8")
 
 
 def compute_subject_progress(log_df: pd.DataFrame) -> dict:
-    progress = {}
     if log_df.empty or "subject" not in log_df.columns:
-        return progress
-    for subj, rows in log_df.groupby("subject"):
-        if pd.isna(subj) or subj == "":
-            continue
-        progress[subj] = lecture_credits_from_rows(rows)
-    return progress
+        return {}
+    done = log_df[log_df["done"] == True]
+    credits = lecture_increments(done["block"]).groupby(done["subject"], observed=True).sum()
+    return {subj: int(n) for subj, n in credits.items() if subj != ""}
 
 
-def sync_subjects_with_log(log_df: pd.DataFrame, subjects: list) -> list:
-    if not subjects:
-        return subjects
-    progress = compute_subject_progress(log_df)
+def _apply_progress(progress: dict, subjects: list) -> bool:
     changed = False
     for s in subjects:
         name = s.get("name")
@@ -804,13 +981,26 @@ def sync_subjects_with_log(log_df: pd.DataFrame, subjects: list) -> list:
             if new_val != s.get("completed_lectures", 0):
                 s["completed_lectures"] = new_val
                 changed = True
-    if changed:
-        save_subjects(subjects)
+    return changed
+
+
+def sync_subjects_with_log(log_df: pd.DataFrame, subjects: list) -> list:
+    if not subjects:
+        return subjects
+    progress = compute_subject_progress(log_df)
+    _apply_progress(progress, subjects)
+    # 시트에는 저장된 사본에만 반영해서 씀 (💾 저장 전의 수정 내용은 올리지 않음)
+    saved = st.session_state._saved_subjects
+    if _apply_progress(progress, saved):
+        save_subjects(saved)
     return subjects
 
 # ----------------- 배지 -----------------
 
-def get_badges(log_df, subjects, streak):
+# (과목 진행 상황, 연속일) 조합이 같으면 rerun 사이에도 결과 재사용
+@st.cache_data(show_spinner=False, max_entries=32)
+def get_badges(subjects_sig: tuple, streak: int):
+    # subjects_sig: (name, completed_lectures, total_lectures) 튜플 모음
     badges = []
     if streak >= 30:
         badges.append(("🏆 30일 연속", "gold"))
@@ -818,12 +1008,19 @@ def get_badges(log_df, subjects, streak):
         badges.append(("🥈 14일 연속", "silver"))
     elif streak >= 7:
         badges.append(("🥉 7일 연속", "bronze"))
-    for s in subjects:
-        if s["completed_lectures"] >= s["total_lectures"]:
-            badges.append((f"📚 {s['name']} 완주!", "gold"))
-        elif s["completed_lectures"] >= s["total_lectures"] * 0.5:
-            badges.append((f"📖 {s['name']} 50%", "silver"))
-    return badges
+    for name, completed, total in subjects_sig:
+        if completed >= total:
+            badges.append((f"📚 {name} 완주!", "gold"))
+        elif completed >= total * 0.5:
+            badges.append((f"📖 {name} 50%", "silver"))
+    return tuple(badges)
+
+# ----------------- 과목 목록 -----------------
+
+def _subject_view(subjects: list):
+    # 활성 과목과 선택지 이름을 rerun마다 한 번만 계산 (캐시보다 해시/언피클 비용이 더 커서 그냥 계산)
+    active_subj = [s for s in subjects if s.get("active", True)]
+    return active_subj, [s["name"] for s in active_subj]
 
 # ----------------- 히트맵 -----------------
 
@@ -832,42 +1029,77 @@ def render_heatmap(log_df, weeks=12):
     start = today - timedelta(weeks=weeks, days=today.weekday())
     daily_data = {}
     if not log_df.empty:
-        for d in pd.date_range(start, today):
-            mask = log_df["date"] == d.date()
-            if mask.any():
-                daily_data[d.date()] = log_df[mask]["estimated_minutes"].sum()
-    cols = st.columns(weeks)
+        daily_data = log_df.groupby("date")["estimated_minutes"].sum().to_dict()
+    # 셀마다 st.markdown을 호출하지 않고 그리드 전체를 한 번에 렌더링
+    html = [
+        '<div style="display:grid;grid-template-rows:repeat(7,12px);'
+        'grid-auto-flow:column;grid-auto-columns:12px;gap:2px;">'
+    ]
     for w in range(weeks):
         ws = start + timedelta(weeks=w)
-        with cols[w]:
-            for d in range(7):
-                cd = ws + timedelta(days=d)
-                if cd > today:
-                    c = "#1a1a1a"
-                elif cd in daily_data:
-                    m = daily_data[cd]
-                    c = "#00d4aa" if m >= 240 else "#00a884" if m >= 120 else "#007a5e" if m >= 30 else "#004d3d"
-                else:
-                    c = "#2d3436"
-                st.markdown(
-                    f'<div style="width:12px;height:12px;background:{c};'
-                    f'border-radius:2px;margin:1px;display:inline-block;" '
-                    f'title="{cd}"></div>',
-                    unsafe_allow_html=True,
-                )
+        for d in range(7):
+            cd = ws + timedelta(days=d)
+            if cd > today:
+                c = "#1a1a1a"
+            elif cd in daily_data:
+                m = daily_data[cd]
+                c = "#00d4aa" if m >= 240 else "#00a884" if m >= 120 else "#007a5e" if m >= 30 else "#004d3d"
+            else:
+                c = "#2d3436"
+            html.append(f'<div style="width:12px;height:12px;background:{c};border-radius:2px;" title="{cd}"></div>')
+    html.append("</div>")
+    st.markdown("".join(html), unsafe_allow_html=True)
+
+def _lazy(name: str, loader):
+    # 처음 실제로 쓰일 때만 만들고 이후에는 세션 값을 재사용
+    if name not in st.session_state:
+        st.session_state[name] = loader()
+    return st.session_state[name]
+
+def _set_log_df(df: pd.DataFrame):
+    # 로그가 바뀔 때마다 새 토큰 발급 → 토큰을 키로 쓰는 캐시가 자동 무효화
+    # 날짜순으로 정렬해 두면 기간 조회를 searchsorted(이진 탐색)로 처리 가능
+    df = df.sort_values("date", kind="stable", ignore_index=True)
+    st.session_state.log_df = df
+    st.session_state.log_token = uuid.uuid4().hex
+    # 날짜별 행을 미리 나눠 두어 선택한 날짜 조회를 dict 조회로 처리
+    st.session_state.log_by_date = dict(tuple(df.groupby("date", sort=False))) if not df.empty else {}
+
+
+# 인자 이름이 _로 시작하면 st.cache_data가 해시하지 않음 (log_token이 캐시 키)
+# 토큰은 저장할 때마다 새로 발급되어 옛 항목은 다시 쓰이지 않으므로 개수 제한
+@st.cache_data(show_spinner=False, max_entries=16)
+def _daily_hours(_log_df: pd.DataFrame, log_token: str) -> pd.Series:
+    ds = _log_df.groupby("date", sort=True)["estimated_minutes"].sum()
+    return (ds / 60).rename("hours")
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _week_minutes(_log_df: pd.DataFrame, log_token: str, week_start: date, week_end: date):
+    # _log_df는 날짜순 정렬 상태 (_set_log_df)
+    dates = _log_df["date"].to_numpy()
+    lo = np.searchsorted(dates, week_start, side="left")
+    hi = np.searchsorted(dates, week_end, side="right")
+    return int(hi - lo), int(_log_df["estimated_minutes"].iloc[lo:hi].sum())
 
 # ----------------- 세션 초기화 -----------------
-if "config" not in st.session_state:
-    st.session_state.config = load_config()
-if "log_df" not in st.session_state:
-    st.session_state.log_df = load_log()
-if "subjects" not in st.session_state:
-    st.session_state.subjects = load_subjects()
+if "_bootstrapped" not in st.session_state:
+    loaded = load_all_sheets()
+    st.session_state.config = loaded["config"]
+    _set_log_df(loaded["log_df"])
+    st.session_state.subjects = loaded["subjects"]
+    # 시트에 반영된 상태의 사본 (과목 탭의 수정 내용은 💾 저장 전까지 여기에 반영하지 않음)
+    st.session_state._saved_subjects = [dict(s) for s in loaded["subjects"]]
+    st.session_state._bootstrapped = True
 
 config = st.session_state.config
 log_df = st.session_state.log_df
 subjects = sync_subjects_with_log(log_df, st.session_state.subjects)
 st.session_state.subjects = subjects
+
+# 강의 동기화 결과와, 이전 실행에서 st.rerun() 직전에 쌓였거나 전송에 실패해 남은 저장 요청 처리
+# (저장 버튼은 그 자리에서 바로 전송)
+_flush_writes()
 today = date.today()
 
 # ----------------- 사이드바 -----------------
@@ -875,7 +1107,8 @@ with st.sidebar:
     st.markdown("## ⚙️ 설정")
     selected_date = st.date_input("📅 작업할 날짜", value=today)
 
-    saved_ctx = get_logged_day_context(log_df, selected_date)
+    today_existing = st.session_state.log_by_date.get(selected_date, log_df.iloc[:0])
+    saved_ctx = get_logged_day_context(today_existing)
     use_saved_ctx = False
     if saved_ctx:
         st.info(
@@ -936,18 +1169,17 @@ with st.sidebar:
     st.markdown(f"**{phase_emoji} {PHASE_LABELS[effective_phase]}**")
 
 # ----------------- 출석 streak -----------------
-unique_dates = sorted(log_df["date"].unique(), reverse=True) if not log_df.empty else []
 streak = 0
-for d in unique_dates:
-    if d > today:
-        continue
-    day_rows = log_df[log_df["date"] == d]
-    if day_rows.empty:
-        break
-    if ((day_rows["done"] == True) & (day_rows["block"] != "OFF")).any():
-        streak += 1
-    else:
-        break
+if not log_df.empty:
+    # 날짜별로 한 번만 집계한 뒤 최근 날짜부터 연속 출석 카운트
+    attended = ((log_df["done"] == True) & (log_df["block"] != "OFF")).groupby(log_df["date"]).any()
+    attended = attended[attended.index <= today].sort_index(ascending=False)
+    streak = sum(1 for _ in takewhile(bool, attended))
+
+subjects_sig = tuple(
+    (s["name"], s["total_lectures"], s["completed_lectures"], s.get("active", True)) for s in subjects
+)
+active_subj, subject_options = _subject_view(subjects)
 
 # ----------------- 메인 -----------------
 st.markdown("# 🎯 Jason 루틴 플랫폼 (GSheet)")
@@ -964,13 +1196,12 @@ with tab_dashboard:
         st.metric("🔥 연속 출석", f"{streak}일")
     with col2:
         checkable = get_checkable_blocks(effective_phase, day_type, mode)
-        mask_today = log_df["date"] == selected_date if not log_df.empty else pd.Series([False])
-        today_done = log_df[mask_today & (log_df["done"] == True)].shape[0] if not log_df.empty else 0
+        today_done = int((today_existing["done"] == True).sum())
         total = max(len(checkable), 1)
         progress = int((today_done / total) * 100)
         st.metric("📈 진행률", f"{progress}%")
     with col3:
-        today_min = log_df[mask_today]["estimated_minutes"].sum() if not log_df.empty else 0
+        today_min = int(today_existing["estimated_minutes"].sum())
         st.metric("⏱️ 공부시간", f"{today_min // 60}시간 {today_min % 60}분")
     with col4:
         today_grade = get_daily_grade(today_min / 60 if today_min else 0)
@@ -991,13 +1222,12 @@ with tab_dashboard:
 
     st.markdown(
         f"""
-    <div class="motivation-box">{get_motivation_message(streak, mode)}</div>
+    <div class="motivation-box">{get_motivation_message(streak, mode, selected_date)}</div>
     """,
         unsafe_allow_html=True,
     )
 
     st.markdown("### 📚 과목별 진도")
-    active_subj = [s for s in subjects if s.get("active", True)]
     if active_subj:
         cols = st.columns(len(active_subj))
         for i, s in enumerate(active_subj):
@@ -1009,7 +1239,7 @@ with tab_dashboard:
     else:
         st.info("📚 '과목 관리'에서 과목을 추가하세요!")
 
-    badges = get_badges(log_df, subjects, streak)
+    badges = get_badges(tuple((n, c, t) for n, t, c, _ in subjects_sig), streak)
     if badges:
         st.markdown("### 🏆 배지")
         st.markdown(
@@ -1033,15 +1263,12 @@ with tab_routine:
     st.info(phase_desc[effective_phase])
 
     schedule = get_detailed_schedule(effective_phase, day_type, mode)
-    mask_today = log_df["date"] == selected_date if not log_df.empty else pd.Series([False])
-    today_existing = log_df[mask_today] if not log_df.empty else pd.DataFrame()
+    # 컬럼별 첫 번째 유효값을 한 번에 추출
+    prev_vals = {} if today_existing.empty else today_existing.bfill().iloc[0].to_dict()
+    done_by_block = {} if today_existing.empty else dict(zip(today_existing["block"], today_existing["done"]))
 
     st.markdown("### 📚 오늘 공부 과목")
-    active_subj = [s for s in subjects if s.get("active", True)]
-    subject_options = [s["name"] for s in active_subj]
-    prev_subject = None
-    if not today_existing.empty and today_existing["subject"].notna().any():
-        prev_subject = str(today_existing["subject"].dropna().iloc[0])
+    prev_subject = str(prev_vals["subject"]) if pd.notna(prev_vals.get("subject")) else None
     subj_index = subject_options.index(prev_subject) if prev_subject in subject_options else 0 if subject_options else 0
     selected_subject = st.selectbox(
         "기록에 남길 과목 (공부 블록에만 적용)",
@@ -1053,19 +1280,17 @@ with tab_routine:
 
     checkbox_states = {}
     block_meta = {}
-    for time, name, category, minutes, desc in schedule:
-        clean_name = name.strip()
-        if clean_name.startswith("└"):
-            clean_name = clean_name[1:].strip()
+    for time, name, clean_name, category, minutes, desc in zip(
+        schedule.times,
+        schedule.names,
+        schedule.clean_names,
+        schedule.categories.tolist(),
+        schedule.minutes.tolist(),
+        schedule.descs,
+    ):
         block_meta[clean_name] = {"minutes": minutes, "category": category}
-        cat_colors = {"morning": "🌅", "study": "📚", "exercise": "💪", "work": "💼", "rest": "😴"}
-        emoji = cat_colors.get(category, "")
-        if category in ["study", "exercise"]:
-            prev = False
-            if not today_existing.empty:
-                prev_rows = today_existing[today_existing["block"] == clean_name]
-                if not prev_rows.empty:
-                    prev = bool(prev_rows.iloc[-1]["done"])
+        if category in CHECKABLE_CATEGORIES:
+            prev = bool(done_by_block.get(clean_name, False))
             time_label = f" [{minutes}분]" if minutes > 0 else ""
             desc_label = f" - {desc}" if desc else ""
             checkbox_states[clean_name] = st.checkbox(
@@ -1074,26 +1299,22 @@ with tab_routine:
                 key=f"cb_{clean_name}",
             )
         else:
+            emoji = CAT_COLORS.get(category, "")
             st.markdown(
                 f"<div style='color:#888; padding:0.3rem 0;'>{emoji} **{time}** {name}</div>",
                 unsafe_allow_html=True,
             )
 
-    checkable = get_checkable_blocks(effective_phase, day_type, mode)
-    total_possible = sum([m for _, m, _ in checkable])
+    # 위 루프에서 만든 block_meta 재사용
+    total_possible = sum(m["minutes"] for m in block_meta.values() if m["category"] in CHECKABLE_CATEGORIES)
     st.markdown(
         f"---\n**📊 체크 시 예상 공부시간: {total_possible}분 ({total_possible//60}시간 {total_possible%60}분)**"
     )
 
     st.markdown("### 🧠 컨디션")
-    prev_energy, prev_focus, prev_note = 3, 3, ""
-    if not today_existing.empty:
-        if today_existing["energy"].notna().any():
-            prev_energy = int(today_existing["energy"].dropna().iloc[0])
-        if today_existing["focus"].notna().any():
-            prev_focus = int(today_existing["focus"].dropna().iloc[0])
-        if today_existing["note"].notna().any():
-            prev_note = str(today_existing["note"].dropna().iloc[0])
+    prev_energy = int(prev_vals["energy"]) if pd.notna(prev_vals.get("energy")) else 3
+    prev_focus = int(prev_vals["focus"]) if pd.notna(prev_vals.get("focus")) else 3
+    prev_note = str(prev_vals["note"]) if pd.notna(prev_vals.get("note")) else ""
     c1, c2 = st.columns(2)
     with c1:
         energy = st.slider("에너지 💪", 1, 5, prev_energy)
@@ -1103,56 +1324,52 @@ with tab_routine:
 
     if st.button("💾 저장하기", type="primary"):
         log_df = log_df[~(log_df["date"] == selected_date)]
+        # 행 dict 목록 대신 컬럼별 배열로 만들어 한 번만 concat
         if mode == "off":
-            new_rows = [
+            blocks = ["OFF"]
+            done_arr = np.ones(1, dtype=bool)
+            minutes = np.zeros(1, dtype=np.int16)
+            subj_vals = [pd.NA]
+        else:
+            blocks = list(checkbox_states)
+            n = len(blocks)
+            done_arr = np.fromiter((checkbox_states[b] for b in blocks), dtype=bool, count=n)
+            mins_arr = np.fromiter((block_meta[b]["minutes"] for b in blocks), dtype=np.int16, count=n)
+            minutes = np.where(done_arr, mins_arr, 0).astype(np.int16)
+            is_study = np.fromiter((block_meta[b]["category"] == "study" for b in blocks), dtype=bool, count=n)
+            subj_vals = np.where(is_study & bool(subject_options), selected_subject, None)
+        if blocks:
+            new_df = pd.DataFrame(
                 {
-                    "date": selected_date,
+                    "date": np.full(len(blocks), selected_date, dtype=object),
                     "phase": effective_phase,
                     "day_type": day_type,
                     "mode": mode,
-                    "block": "OFF",
-                    "done": True,
-                    "estimated_minutes": 0,
+                    "block": blocks,
+                    "done": done_arr,
+                    "estimated_minutes": minutes,
                     "energy": energy,
                     "focus": focus,
                     "note": note,
-                    "subject": pd.NA,
+                    "subject": subj_vals,
                 }
-            ]
-        else:
-            new_rows = []
-            for block, done in checkbox_states.items():
-                meta = block_meta.get(block, {})
-                est_min = meta.get("minutes", 0)
-                subj_val = selected_subject if meta.get("category") == "study" and subject_options else pd.NA
-                new_rows.append(
-                    {
-                        "date": selected_date,
-                        "phase": effective_phase,
-                        "day_type": day_type,
-                        "mode": mode,
-                        "block": block,
-                        "done": bool(done),
-                        "estimated_minutes": est_min if done else 0,
-                        "energy": energy,
-                        "focus": focus,
-                        "note": note,
-                        "subject": subj_val,
-                    }
-                )
-        if new_rows:
-            log_df = pd.concat([log_df, pd.DataFrame(new_rows)], ignore_index=True)
-        st.session_state.log_df = log_df
+            )
+            log_df = _apply_log_dtypes(pd.concat([log_df, new_df], ignore_index=True))
+        _set_log_df(log_df)
+        log_df = st.session_state.log_df
         subjects = sync_subjects_with_log(log_df, subjects)
         st.session_state.subjects = subjects
         save_log(log_df)
-        st.success("✅ 저장 완료!")
-        st.rerun()
+        # 저장 직후 바로 전송하고, 성공했을 때만 완료 표시
+        if _flush_writes():
+            st.success("✅ 저장 완료!")
+            st.rerun()
 
 # ==================== 과목 관리 ====================
 with tab_subjects:
     st.markdown("## 📚 과목 관리")
-    st.caption("강의 수는 유동적으로 변경 가능, 여러 과목 동시 진행 OK")
+    st.caption("강의 수는 유동적으로 변경 가능, 여러 과목 동시 진행 OK (수정 후 💾 저장을 눌러야 시트에 반영)")
+    saved_subjects = st.session_state._saved_subjects
     for idx, s in enumerate(subjects):
         with st.expander(f"📖 {s['name']} ({s['completed_lectures']}/{s['total_lectures']}강)", expanded=True):
             c1, c2, c3 = st.columns([2, 1, 1])
@@ -1170,18 +1387,25 @@ with tab_subjects:
             with c5:
                 if st.button("🗑️ 삭제", key=f"sd_{idx}"):
                     subjects.pop(idx)
-                    save_subjects(subjects)
+                    saved_subjects.pop(idx)
+                    save_subjects(saved_subjects)
                     st.session_state.subjects = subjects
                     st.rerun()
             if nn != s["name"] or nt != s["total_lectures"] or nc != s["completed_lectures"] or na != s.get("active", True):
+                # 입력할 때마다 시트에 쓰지 않고 세션에만 반영
                 subjects[idx] = {
                     "name": nn,
                     "total_lectures": nt,
                     "completed_lectures": nc,
                     "active": na,
                 }
-                save_subjects(subjects)
                 st.session_state.subjects = subjects
+            if st.button("💾 저장", key=f"save_s_{idx}"):
+                # 이 과목의 수정 내용만 저장된 사본에 반영해서 씀
+                saved_subjects[idx] = dict(subjects[idx])
+                save_subjects(saved_subjects)
+                if _flush_writes():
+                    st.success("✅ 저장 완료!")
     st.markdown("---\n### ➕ 새 과목")
     c1, c2 = st.columns(2)
     with c1:
@@ -1198,7 +1422,8 @@ with tab_subjects:
                     "active": True,
                 }
             )
-            save_subjects(subjects)
+            saved_subjects.append(dict(subjects[-1]))
+            save_subjects(saved_subjects)
             st.session_state.subjects = subjects
             st.success(f"✅ '{new_name}' 추가됨")
             st.rerun()
@@ -1212,12 +1437,10 @@ with tab_analysis:
         st.markdown("### 📆 주간 요약")
         week_ref = st.date_input("주 선택", today, key="wa")
         ws, we = get_week_range(week_ref)
-        mask = (log_df["date"] >= ws) & (log_df["date"] <= we)
-        wd = log_df[mask]
-        if wd.empty:
+        week_rows, tm = _week_minutes(log_df, st.session_state.log_token, ws, we)
+        if week_rows == 0:
             st.write("이 주에 기록 없음")
         else:
-            tm = wd["estimated_minutes"].sum()
             th = round(tm / 60, 1)
             grade = "D-" if th < 18 else "A" if th < 22 else "B" if th < 27 else "C" if th < 32 else "S"
             c1, c2 = st.columns(2)
@@ -1226,12 +1449,11 @@ with tab_analysis:
             with c2:
                 st.metric("주간 등급", f"{grade}", help=WEEKLY_GRADE_HINT)
         st.markdown("---\n### 📈 장기 추세")
-        ds = log_df.groupby("date")["estimated_minutes"].sum().reset_index()
-        ds["hours"] = ds["estimated_minutes"] / 60
-        st.line_chart(ds.set_index("date")["hours"], height=200)
+        daily = _daily_hours(log_df, st.session_state.log_token)
+        st.line_chart(daily, height=200)
         l7 = today - timedelta(days=6)
-        r = ds[(ds["date"] >= l7) & (ds["date"] <= today)]
-        avg7 = r["hours"].mean() if not r.empty else 0
+        r = daily.iloc[daily.index.searchsorted(l7, side="left") : daily.index.searchsorted(today, side="right")]
+        avg7 = r.mean() if not r.empty else 0
         c1, c2 = st.columns(2)
         with c1:
             st.metric("최근 7일 평균", f"{avg7:.1f}h/일")
@@ -1244,23 +1466,22 @@ with tab_excel:
     st.caption("이 탭은 엑셀 내용을 그대로 옮겨둔 것으로, 제거 시 이 블록과 상수만 삭제하면 됩니다.")
 
     st.markdown("### ✅ Overview")
-    for item in EXCEL_OVERVIEW:
-        st.markdown(f"- {item}")
+    st.markdown("\n".join(f"- {item}" for item in EXCEL_OVERVIEW))
 
     st.markdown("### 🗓️ Weekly Timeblocks")
-    st.dataframe(pd.DataFrame(EXCEL_WEEKLY_TIMEBLOCKS), use_container_width=True)
+    st.dataframe(_lazy("_plan_weekly_timeblocks_df", lambda: pd.DataFrame(EXCEL_WEEKLY_TIMEBLOCKS)), use_container_width=True)
 
     st.markdown("### 🌙 Friday Rotation")
-    st.dataframe(pd.DataFrame(EXCEL_FRIDAY_ROTATION), use_container_width=True)
+    st.dataframe(_lazy("_plan_friday_rotation_df", lambda: pd.DataFrame(EXCEL_FRIDAY_ROTATION)), use_container_width=True)
 
     st.markdown("### 📆 12-Week Micro Plan")
-    st.dataframe(pd.DataFrame(EXCEL_MICRO_PLAN), use_container_width=True)
+    st.dataframe(_lazy("_plan_micro_plan_df", lambda: pd.DataFrame(EXCEL_MICRO_PLAN)), use_container_width=True)
 
     st.markdown("### 🎧 Logic Quick Checklist")
-    st.dataframe(pd.DataFrame(EXCEL_LOGIC_CHECKLIST), use_container_width=True)
+    st.dataframe(_lazy("_plan_logic_checklist_df", lambda: pd.DataFrame(EXCEL_LOGIC_CHECKLIST)), use_container_width=True)
 
     st.markdown("### 🧁 Baking Quick Checklist")
-    st.dataframe(pd.DataFrame(EXCEL_BAKING_CHECKLIST), use_container_width=True)
+    st.dataframe(_lazy("_plan_baking_checklist_df", lambda: pd.DataFrame(EXCEL_BAKING_CHECKLIST)), use_container_width=True)
 
 with tab_philosophy:
     st.markdown(
@@ -1327,23 +1548,21 @@ with tab_settings:
         )
 
     if st.button("💾 설정 저장", type="primary"):
-        config.update(
-            {
-                "start_date": new_start.isoformat(),
-                "target_exam": new_target.isoformat(),
-                "auto_phase": auto_flag,
-                "manual_phase": mp,
-                "_start_date_obj": new_start,
-                "_target_exam_obj": new_target,
-            }
-        )
-        st.session_state.config = config
-        save_config(config)
-        st.success("✅ 저장 완료!")
+        new_values = {
+            "start_date": new_start.isoformat(),
+            "target_exam": new_target.isoformat(),
+            "auto_phase": auto_flag,
+            "manual_phase": mp,
+        }
+        if all(str(config.get(k)) == str(v) for k, v in new_values.items()):
+            st.info("변경 사항이 없습니다.")
+        else:
+            config.update(new_values)
+            config.update({"_start_date_obj": new_start, "_target_exam_obj": new_target})
+            st.session_state.config = config
+            save_config(config)
+            if _flush_writes():
+                st.success("✅ 저장 완료!")
 
     st.markdown("---\n### 📂 데이터 저장소")
-    try:
-        sheet_url = st.secrets["gsheet"]["spreadsheet_url"]
-    except Exception:
-        sheet_url = "(secrets에 spreadsheet_url 없음)"
-    st.code(f"스프레드시트: {sheet_url}\n시트: config / log / subjects")
+    st.code(f"스프레드시트: {SPREADSHEET_URL}\n시트: config / log / subjects")